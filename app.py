@@ -1,351 +1,799 @@
 import sys
 import os
+import re
 import zipfile
 from pathlib import Path
 from typing import List, Dict
 import shutil
 import logging
+import queue
+import time
+import functools
+import threading
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait as wait_futures
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QPushButton, QLabel, QFileDialog, QCheckBox, 
                             QProgressBar, QTextEdit, QSpinBox, QGroupBox, QGridLayout,
                             QMessageBox, QLineEdit, QComboBox)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 import cairosvg
 from cairosvg import svg2eps
 from PIL import Image
 import subprocess
-import tempfile
+import io
 
-class ConversionWorker(QThread):
-    progress_update = pyqtSignal(int, str)
-    log_update = pyqtSignal(str)
-    finished = pyqtSignal()
-    error_occurred = pyqtSignal(str)
+try:
+    # Rust-backed renderer, much faster than cairosvg for PNG/JPG output
+    import resvg_py
+except ImportError:
+    resvg_py = None
 
-    def __init__(self, svg_files, output_dir, selected_formats, scale_factor, force_1x1):
-        super().__init__()
-        self.svg_files = svg_files
+# FileConverter of a worker process, set by _init_process
+_converter = None
+
+# Output directory name of each platform
+PLATFORMS = {
+    'shutterstock': 'Shutterstock',
+    'vectorstock': 'Vectorstock', 
+    'pngtree': 'PNGTree',
+    'dreamstime': 'Dreamstime',
+    'adobestock': 'AdobeStock',
+    'canva': 'Canva',
+    'miricanvas': 'MiriCanvas',
+    'desainstock': 'Desainstock'
+}
+
+# Longest edge (px) worth rendering for each platform's raster output. Larger
+# renders are only downscaled by the platform, so sizes are capped to these.
+PLATFORM_MAX_SIZE = {
+    'Vectorstock': 5000,
+    'PNGTree': 5000,
+    'Dreamstime': 6000,
+    'Canva': 2000,
+    'Desainstock': 4000,
+}
+
+# (platform key, FileConverter method, output directory) in processing order
+PLATFORM_TASKS = [
+    ('shutterstock', 'convert_to_eps', 'Shutterstock'),    # EPS
+    ('vectorstock', 'convert_to_eps', 'Vectorstock'),      # EPS + JPG
+    ('vectorstock', 'convert_to_jpg', 'Vectorstock'),
+    ('pngtree', 'convert_to_zip', 'PNGTree'),              # PNG + EPS + ZIP
+    ('dreamstime', 'convert_to_jpg', 'Dreamstime'),        # JPG + EPS
+    ('dreamstime', 'convert_to_eps', 'Dreamstime'),
+    ('adobestock', 'copy_svg', 'AdobeStock'),              # SVG only
+    ('canva', 'convert_to_png', 'Canva'),                  # PNG
+    ('miricanvas', 'convert_svg_cropped', 'MiriCanvas'),   # SVG cropped
+    ('desainstock', 'convert_to_jpg', 'Desainstock'),      # JPG
+]
+
+# Root <svg> tag (group 1) and the size attributes read from it by _get_svg_dimensions;
+# comments, processing instructions and the DOCTYPE are matched only to be skipped
+_SVG_TAG_RE = re.compile(rb'<!--.*?-->|<\?.*?\?>|<!DOCTYPE(?:[^\[>]|\[.*?\])*>'
+                         rb'|(<svg\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)', re.IGNORECASE | re.DOTALL)
+_SVG_WIDTH_RE = re.compile(rb'(?<![\w:-])width\s*=\s*["\']([^"\']*)["\']')
+_SVG_HEIGHT_RE = re.compile(rb'(?<![\w:-])height\s*=\s*["\']([^"\']*)["\']')
+_SVG_VIEWBOX_RE = re.compile(rb'(?<![\w:-])viewBox\s*=\s*["\']([^"\']*)["\']')
+_LENGTH_RE = re.compile(rb'^\s*(\d+\.?\d*|\.\d+)\s*([a-z%]*)\s*$', re.IGNORECASE)
+# Encoding named in the XML declaration, which resvg needs decoded text for
+_XML_ENCODING_RE = re.compile(rb'^(?:\xef\xbb\xbf)?\s*<\?xml\b[^>]*?\bencoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+
+# CSS pixels per unit (96 dpi), as used by the renderers
+_UNIT_PX = {
+    b'': 1.0,
+    b'px': 1.0,
+    b'pt': 96 / 72,
+    b'pc': 16.0,
+    b'mm': 96 / 25.4,
+    b'cm': 96 / 2.54,
+    b'in': 96.0,
+}
+
+
+def _parse_length(value):
+    """Convert an SVG width/height value to pixels; None for relative units like %."""
+    match = _LENGTH_RE.match(value)
+    if not match:
+        return None
+    factor = _UNIT_PX.get(match.group(2).lower())
+    if factor is None:
+        return None
+    return float(match.group(1)) * factor
+
+
+def render_png(svg_data, svg_file, width=None, height=None, scale=1):
+    """Rasterize SVG source bytes to PNG bytes, using resvg when it is installed.
+
+    svg_file is only used to resolve relative references (linked images).
+    """
+    if resvg_py is not None:
+        resources_dir = os.path.dirname(os.path.abspath(svg_file))
+        try:
+            # Decode strictly: a file that doesn't match its encoding goes to cairosvg as raw bytes
+            declared = _XML_ENCODING_RE.match(svg_data)
+            svg_string = svg_data.decode(declared.group(1).decode('ascii') if declared else 'utf-8-sig')
+            if width and height:
+                # resvg fits the drawing inside width x height; pad it to the exact size like cairosvg
+                png_data = bytes(resvg_py.svg_to_bytes(svg_string=svg_string, resources_dir=resources_dir,
+                                                       width=width, height=height))
+                return _center_on_canvas(png_data, width, height)
+            return bytes(resvg_py.svg_to_bytes(svg_string=svg_string, resources_dir=resources_dir, zoom=scale))
+        except Exception:
+            # Unknown encodings, undecodable bytes and sizes resvg rejects (e.g. width/height
+            # in mm) are all left to cairosvg
+            pass
+    
+    if width and height:
+        return cairosvg.svg2png(bytestring=svg_data, url=svg_file, output_width=width, output_height=height)
+    return cairosvg.svg2png(bytestring=svg_data, url=svg_file, scale=scale)
+
+
+def _center_on_canvas(png_data, width, height):
+    """Center a PNG render on a transparent width x height canvas."""
+    img = Image.open(io.BytesIO(png_data))
+    if img.size == (width, height):
+        return png_data
+    
+    canvas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    canvas.paste(img.convert('RGBA'), ((width - img.width) // 2, (height - img.height) // 2))
+    output = io.BytesIO()
+    canvas.save(output, 'PNG')
+    return output.getvalue()
+
+
+def _needs_rebuild(src, dst):
+    """True unless dst exists and is at least as new as src"""
+    try:
+        return os.path.getmtime(dst) < os.path.getmtime(src)
+    except OSError:
+        return True
+
+
+def _atomic_write(final_path, writer):
+    """Call writer(tmp_path) and move the result over final_path in one step.
+
+    An interrupted write never leaves a truncated output behind that the
+    up-to-date check would accept later.
+    """
+    final_path = Path(final_path)
+    # Keep the extension last; Inkscape picks the export format from it
+    tmp_path = str(final_path.with_name(f"{final_path.stem}.tmp{os.getpid()}{final_path.suffix}"))
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, final_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def find_inkscape():
+    """Locate the Inkscape executable; cached as it never changes during a run"""
+    # Hardcode untuk Windows
+    possible_paths = [
+        r"C:\Program Files\Inkscape\bin\inkscape.exe",
+        r"C:\Program Files\Inkscape\inkscape.exe"
+    ]
+    for p in possible_paths:
+        if os.path.exists(p):
+            return p
+
+    # Hardcode untuk macOS
+    mac_path = "/Applications/Inkscape.app/Contents/MacOS/inkscape"
+    if os.path.exists(mac_path):
+        return mac_path
+
+    # fallback
+    return shutil.which("inkscape")
+
+
+class _InkscapeShell:
+    """A long-running ``inkscape --shell`` process that exports files on request.
+
+    Starting Inkscape takes the better part of a second, so each worker process
+    keeps a shell open for the whole batch instead of launching one per SVG.
+    """
+    PROMPT = "> "
+    # Seconds to wait for a prompt (startup or one export) before giving up on the shell
+    TIMEOUT = 120
+
+    def __init__(self, inkscape_exe):
+        self.process = subprocess.Popen(
+            [inkscape_exe, "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        # Pipes can't be read with a timeout on every platform, so a thread
+        # feeds stdout into a queue that _read_until_prompt waits on
+        self._stdout = queue.Queue()
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        # Skip the banner up to the first prompt
+        self._read_until_prompt()
+
+    def _pump_stdout(self):
+        while True:
+            char = self.process.stdout.read(1)
+            self._stdout.put(char)
+            if not char:
+                break
+
+    def _read_until_prompt(self):
+        output = []
+        deadline = time.monotonic() + self.TIMEOUT
+        while True:
+            try:
+                char = self._stdout.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Unknown prompt or a stalled Inkscape: drop the shell so the caller falls back
+                self.process.kill()
+                self.process.wait()
+                raise subprocess.TimeoutExpired("inkscape --shell", self.TIMEOUT, "".join(output))
+            if not char:
+                raise subprocess.CalledProcessError(self.process.wait(), "inkscape --shell", "".join(output))
+            output.append(char)
+            if char == " " and "".join(output[-len(self.PROMPT):]) == self.PROMPT:
+                return "".join(output[:-len(self.PROMPT)])
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def export(self, svg_file, output_path, actions):
+        """Open svg_file, apply the export actions and write output_path."""
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        
+        command = "; ".join([f"file-open:{svg_file}", *actions,
+                             f"export-filename:{output_path}", "export-do", "file-close"])
+        try:
+            self.process.stdin.write(command + "\n")
+            self.process.stdin.flush()
+        except OSError:
+            self.process.kill()
+            self.process.wait()
+            raise
+        output = self._read_until_prompt()
+        
+        if not os.path.exists(output_path):
+            raise subprocess.CalledProcessError(1, command, output)
+
+    def close(self):
+        if self.is_alive():
+            try:
+                self.process.stdin.write("quit\n")
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+
+
+# Inkscape shells of this process, one per kind of export since export
+# options stay set between commands
+_inkscape_shells = {}
+
+
+def _inkscape_shell(kind, inkscape_exe):
+    """Return this process's Inkscape shell for the given kind of export"""
+    shell = _inkscape_shells.get(kind)
+    if shell is None or not shell.is_alive():
+        shell = _InkscapeShell(inkscape_exe)
+        _inkscape_shells[kind] = shell
+        # Quit Inkscape when the worker process exits
+        multiprocessing.util.Finalize(shell, shell.close, exitpriority=10)
+    return shell
+
+
+# Set once a shell of this process failed to start or stopped answering; later
+# exports then run Inkscape once per file instead of waiting on a new shell
+_inkscape_shell_failed = False
+
+
+def _inkscape_export(kind, inkscape_exe, svg_file, output_path, actions):
+    """Export svg_file with Inkscape, through this process's shell while it works"""
+    global _inkscape_shell_failed
+    if not _inkscape_shell_failed:
+        shell = None
+        try:
+            shell = _inkscape_shell(kind, inkscape_exe)
+            shell.export(svg_file, output_path, actions)
+            return
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            if shell is not None and shell.is_alive():
+                # The shell still answers, only this file failed to export
+                raise
+            _inkscape_shell_failed = True
+    
+    # One-shot CLI; each export action "name[:value]" is the option --name[=value]
+    cmd = [inkscape_exe, *(f"--{action.replace(':', '=', 1)}" for action in actions),
+           "-o", output_path, svg_file]
+    subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace',
+                   timeout=_InkscapeShell.TIMEOUT)
+
+
+class FileConverter:
+    """Converts single SVG files for the selected platforms.
+
+    Plain (Qt-free) object, built once in each worker process; log lines
+    are handed to the ``log`` callable.
+    """
+
+    def __init__(self, output_dir, selected_formats, scale_factor, force_1x1, force_rebuild=False, log=print):
         self.output_dir = output_dir
         self.selected_formats = selected_formats
         self.scale_factor = scale_factor
         self.force_1x1 = force_1x1
-        
-    def run(self):
-        try:
-            total_files = len(self.svg_files)
-            
-            # Create output directories
-            self.create_output_directories()
-            
-            for i, svg_file in enumerate(self.svg_files):
-                current_progress = int((i / total_files) * 100)
-                file_name = os.path.basename(svg_file)
-                
-                self.progress_update.emit(current_progress, f"[{i+1}/{total_files}] Processing {file_name}")
-                self.log_update.emit(f"Processing: {file_name}")
-                
-                # Process each selected format
-                self.process_file(svg_file, file_name)
-                
-            self.progress_update.emit(100, "Conversion completed!")
-            self.log_update.emit("All conversions completed successfully!")
-            self.finished.emit()
-            
-        except Exception as e:
-            self.error_occurred.emit(str(e))
-    
-    def create_output_directories(self):
-        """Create output directories for each platform"""
-        platforms = {
-            'shutterstock': 'Shutterstock',
-            'vectorstock': 'Vectorstock', 
-            'pngtree': 'PNGTree',
-            'dreamstime': 'Dreamstime',
-            'adobestock': 'AdobeStock',
-            'canva': 'Canva',
-            'miricanvas': 'MiriCanvas',
-            'desainstock': 'Desainstock'
+        self.force_rebuild = force_rebuild
+        self.log = log
+        # Conversion steps for the selected platforms, resolved once per batch
+        self._tasks = [
+            (getattr(self, method), platform_name)
+            for platform_key, method, platform_name in PLATFORM_TASKS
+            if platform_key in selected_formats
+        ]
+        # Output directory of each selected platform, by platform directory name
+        output_root = Path(output_dir)
+        self._platform_paths = {
+            platform_name: output_root / platform_name
+            for platform_key, platform_name in PLATFORMS.items()
+            if platform_key in selected_formats
         }
-        
-        for platform_key, platform_name in platforms.items():
-            if platform_key in self.selected_formats:
-                platform_dir = os.path.join(self.output_dir, platform_name)
-                os.makedirs(platform_dir, exist_ok=True)
-                self.log_update.emit(f"Created directory: {platform_dir}")
+        # Contents of the SVG being processed, read on first use
+        self._svg_data = None
+        # Encoded PNG/JPG renders (and parsed dimensions) of the current file, keyed by format and size
+        self._renders = {}
     
     def process_file(self, svg_file, file_name):
         """Process a single SVG file for all selected formats"""
+        self.log(f"Processing: {file_name}")
         base_name = os.path.splitext(file_name)[0]
+        # Renders are only shared between the outputs of one file
+        self._renders.clear()
+        self._svg_data = None
         
-        # Shutterstock - EPS
-        if 'shutterstock' in self.selected_formats:
-            self.convert_to_eps(svg_file, base_name, 'Shutterstock')
-            
-        # Vectorstock - EPS + JPG
-        if 'vectorstock' in self.selected_formats:
-            self.convert_to_eps(svg_file, base_name, 'Vectorstock')
-            self.convert_to_jpg(svg_file, base_name, 'Vectorstock')
-            
-        # PNGTree - PNG + EPS + ZIP
-        if 'pngtree' in self.selected_formats:
-            png_path = self.convert_to_png(svg_file, base_name, 'PNGTree')
-            eps_path = self.convert_to_eps(svg_file, base_name, 'PNGTree')
-            zip_path = self.create_zip_file([png_path, eps_path], base_name, 'PNGTree')
-            
-            # Delete PNG and EPS files after ZIP creation
-            self.delete_files([png_path, eps_path])
-            
-        # Dreamstime - JPG + EPS
-        if 'dreamstime' in self.selected_formats:
-            self.convert_to_jpg(svg_file, base_name, 'Dreamstime')
-            self.convert_to_eps(svg_file, base_name, 'Dreamstime')
-            
-        # AdobeStock - SVG only
-        if 'adobestock' in self.selected_formats:
-            self.copy_svg(svg_file, base_name, 'AdobeStock')
-            
-        # Canva - PNG
-        if 'canva' in self.selected_formats:
-            self.convert_to_png(svg_file, base_name, 'Canva')
-            
-        # MiriCanvas - SVG cropped
-        if 'miricanvas' in self.selected_formats:
-            self.convert_svg_cropped(svg_file, base_name, 'MiriCanvas')
-            
-        # Desainstock - JPG
-        if 'desainstock' in self.selected_formats:
-            self.convert_to_jpg(svg_file, base_name, 'Desainstock')
+        for convert, platform in self._tasks:
+            convert(svg_file, base_name, platform)
+        
+        self._renders.clear()
+        self._svg_data = None
+    
+    def _svg_bytes(self, svg_file):
+        """Contents of the current SVG, read once and only if an output needs building."""
+        if self._svg_data is None:
+            with open(svg_file, 'rb') as f:
+                self._svg_data = f.read()
+        return self._svg_data
+    
+    def _up_to_date(self, svg_file, output_path):
+        """Check whether output_path can be kept as-is from an earlier run."""
+        if self.force_rebuild or _needs_rebuild(svg_file, output_path):
+            return False
+        self.log(f"Skipped (up to date): {output_path}")
+        return True
     
     def _get_svg_dimensions(self, svg_file):
-        """Parse SVG to get its dimensions."""
+        """Read the SVG dimensions from the attributes of the root <svg> tag."""
         try:
-            import re
-            import xml.etree.ElementTree as ET
-            
-            tree = ET.parse(svg_file)
-            root = tree.getroot()
+            # The root tag sits at the top of the file, so avoid parsing the whole document
+            tag = next((match.group(1) for match in _SVG_TAG_RE.finditer(self._svg_bytes(svg_file))
+                        if match.group(1)), None)
+            if not tag:
+                raise ValueError("no <svg> element found")
             
-            width_str = root.get('width')
-            height_str = root.get('height')
+            width_match = _SVG_WIDTH_RE.search(tag)
+            height_match = _SVG_HEIGHT_RE.search(tag)
             
             width = None
             height = None
 
-            if width_str:
-                match = re.search(r'(\d+\.?\d*)', width_str)
-                if match:
-                    width = float(match.group(1))
+            if width_match:
+                width = _parse_length(width_match.group(1))
             
-            if height_str:
-                match = re.search(r'(\d+\.?\d*)', height_str)
-                if match:
-                    height = float(match.group(1))
+            if height_match:
+                height = _parse_length(height_match.group(1))
 
             if width and height:
                 return width, height
 
-            # Fallback to viewBox if width/height are not present
-            viewBox = root.get('viewBox')
-            if viewBox:
-                parts = viewBox.split()
+            # Fallback to viewBox if width/height are not present or relative (%)
+            viewbox_match = _SVG_VIEWBOX_RE.search(tag)
+            if viewbox_match:
+                parts = viewbox_match.group(1).replace(b',', b' ').split()
                 if len(parts) == 4:
                     return float(parts[2]), float(parts[3])
             
             return None, None # Could not determine dimensions
         except Exception as e:
-            self.log_update.emit(f"Could not parse SVG dimensions for {os.path.basename(svg_file)}: {e}")
+            self.log(f"Could not parse SVG dimensions for {os.path.basename(svg_file)}: {e}")
             return None, None
     
+    def _render_size(self, svg_file, platform):
+        """Return the (width, height, scale) used to rasterize for a platform.
+
+        Raster sizes beyond the platform's PLATFORM_MAX_SIZE are capped to it;
+        vector EPS output is not capped.
+        """
+        max_size = PLATFORM_MAX_SIZE.get(platform)
+        if self.force_1x1:
+            base_dim = int(1000 * self.scale_factor)
+            if max_size:
+                base_dim = min(base_dim, max_size)
+            return base_dim, base_dim, 1
+        
+        if max_size:
+            width, height = self._svg_dimensions(svg_file)
+            if width and height and max(width, height) * self.scale_factor > max_size:
+                # Lower the scale so the longest edge fits the cap
+                return None, None, max_size / max(width, height)
+        return None, None, self.scale_factor
+    
+    def _svg_dimensions(self, svg_file):
+        """_get_svg_dimensions, parsed once per file."""
+        key = ('dimensions', svg_file)
+        if key not in self._renders:
+            self._renders[key] = self._get_svg_dimensions(svg_file)
+        return self._renders[key]
+    
+    def _rendered_size(self, svg_file, platform):
+        """Pixel size of the platform's render, as reported in the log."""
+        width, height = Image.open(io.BytesIO(self._render_png(svg_file, platform))).size
+        return f"{width}x{height}px"
+    
+    def _render_png(self, svg_file, platform):
+        """Rasterize SVG to PNG bytes at the platform's size.
+
+        Renders once per file and size; every PNG and JPG output of that size
+        shares the result.
+        """
+        key = ('png',) + self._render_size(svg_file, platform)
+        if key not in self._renders:
+            width, height, scale = key[1:]
+            self._renders[key] = render_png(self._svg_bytes(svg_file), svg_file, width=width, height=height, scale=scale)
+        return self._renders[key]
+    
+    def _render_jpg(self, svg_file, platform):
+        """Encode the PNG render as JPG bytes, once per file and size."""
+        key = ('jpg',) + self._render_size(svg_file, platform)
+        if key not in self._renders:
+            img = Image.open(io.BytesIO(self._render_png(svg_file, platform)))
+            
+            # Convert PNG to JPG with white background
+            if img.mode in ('RGBA', 'LA'):
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                if img.getextrema()[3][0] == 255:
+                    # Fully opaque: nothing to blend, just drop the alpha channel
+                    img = img.convert('RGB')
+                else:
+                    background = Image.new('RGB', img.size, (255, 255, 255))
+                    background.paste(img, mask=img.getchannel('A'))
+                    img = background
+            else:
+                img = img.convert('RGB')
+            
+            jpg_data = io.BytesIO()
+            img.save(jpg_data, 'JPEG', quality=95)
+            self._renders[key] = jpg_data.getvalue()
+        return self._renders[key]
+    
     def convert_to_png(self, svg_file, base_name, platform):
         """Convert SVG to PNG with transparency, with optional 1:1 aspect ratio."""
-        output_path = os.path.join(self.output_dir, platform, f"{base_name}.png")
+        output_path = self._platform_paths[platform] / f"{base_name}.png"
         
-        if self.force_1x1:
-            base_dim = int(1000 * self.scale_factor)
-            cairosvg.svg2png(
-                url=svg_file,
-                write_to=output_path,
-                output_width=base_dim,
-                output_height=base_dim
-            )
-            self.log_update.emit(f"Created PNG (transparent, {base_dim}x{base_dim}px): {output_path}")
-        else:
-            cairosvg.svg2png(
-                url=svg_file,
-                write_to=output_path,
-                scale=self.scale_factor
-            )
-            self.log_update.emit(f"Created PNG (transparent, scaled by {self.scale_factor}x): {output_path}")
+        if self._up_to_date(svg_file, output_path):
+            return output_path
+        
+        png_data = self._render_png(svg_file, platform)
+        _atomic_write(output_path, lambda tmp_path: Path(tmp_path).write_bytes(png_data))
+        
+        size = self._rendered_size(svg_file, platform)
+        self.log(f"Created PNG (transparent, {size}): {output_path}")
             
         return output_path
     
     def convert_to_jpg(self, svg_file, base_name, platform):
         """Convert SVG to JPG, with optional 1:1 aspect ratio."""
-        output_path = os.path.join(self.output_dir, platform, f"{base_name}.jpg")
+        output_path = self._platform_paths[platform] / f"{base_name}.jpg"
         
-        # Convert to PNG first, then to JPG
-        temp_png = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        if self.force_1x1:
-            base_dim = int(1000 * self.scale_factor)
-            cairosvg.svg2png(
-                url=svg_file,
-                write_to=temp_png.name,
-                output_width=base_dim,
-                output_height=base_dim
-            )
-        else:
-            cairosvg.svg2png(
-                url=svg_file,
-                write_to=temp_png.name,
-                scale=self.scale_factor
-            )
-        
-        # Convert PNG to JPG with white background
-        img = Image.open(temp_png.name)
-        if img.mode in ('RGBA', 'LA'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        img.save(output_path, 'JPEG', quality=95)
-        os.unlink(temp_png.name)
-        
-        self.log_update.emit(f"Created JPG: {output_path}")
+        if self._up_to_date(svg_file, output_path):
+            return output_path
+        
+        # Platforms sharing the render size get the same encoded JPG
+        jpg_data = self._render_jpg(svg_file, platform)
+        _atomic_write(output_path, lambda tmp_path: Path(tmp_path).write_bytes(jpg_data))
+        
+        size = self._rendered_size(svg_file, platform)
+        self.log(f"Created JPG ({size}): {output_path}")
         return output_path
     
     def convert_to_eps(self, svg_file, base_name, platform):
         """Convert SVG to EPS using cairosvg with scaling support"""
-        output_path = os.path.join(self.output_dir, platform, f"{base_name}.eps")
+        output_path = self._platform_paths[platform] / f"{base_name}.eps"
+        
+        if self._up_to_date(svg_file, output_path):
+            return output_path
         
         try:
             if self.force_1x1:
                 base_dim = int(1000 * self.scale_factor)
-                svg2eps(
+                _atomic_write(output_path, lambda tmp_path: svg2eps(
+                    bytestring=self._svg_bytes(svg_file),
                     url=svg_file,
-                    write_to=output_path,
+                    write_to=tmp_path,
                     output_width=base_dim,
                     output_height=base_dim
-                )
-                self.log_update.emit(f"Created EPS ({base_dim}x{base_dim}px): {output_path}")
+                ))
+                self.log(f"Created EPS ({base_dim}x{base_dim}px): {output_path}")
             else:
-                svg2eps(
+                _atomic_write(output_path, lambda tmp_path: svg2eps(
+                    bytestring=self._svg_bytes(svg_file),
                     url=svg_file,
-                    write_to=output_path,
+                    write_to=tmp_path,
                     scale=self.scale_factor
-                )
-                self.log_update.emit(f"Created EPS (scaled by {self.scale_factor}x): {output_path}")
+                ))
+                self.log(f"Created EPS (scaled by {self.scale_factor}x): {output_path}")
         except Exception as e:
-            self.log_update.emit(f"ERROR creating EPS with cairosvg: {e}")
+            self.log(f"ERROR creating EPS with cairosvg: {e}")
             # Fallback to Inkscape if cairosvg fails, as it might handle complex SVGs better
-            self.log_update.emit("cairosvg failed, falling back to Inkscape for EPS conversion.")
+            self.log("cairosvg failed, falling back to Inkscape for EPS conversion.")
             try:
-                inkscape_exe = self.find_inkscape()
+                inkscape_exe = find_inkscape()
                 if not inkscape_exe:
                     raise FileNotFoundError("Inkscape executable not found for fallback")
                 
                 # Get original dimensions and scale width, preserving aspect ratio
-                width, _ = self._get_svg_dimensions(svg_file)
-                cmd = [inkscape_exe]
+                width, _ = self._svg_dimensions(svg_file)
                 if width:
-                    cmd.append(f"--export-width={int(width * self.scale_factor)}")
+                    export_width = int(width * self.scale_factor)
                 else:
                     # Fallback if dimensions can't be parsed: use a default scaled width
-                    self.log_update.emit(f"Could not determine SVG width, using default for scaling.")
-                    cmd.append(f"--export-width={int(1000 * self.scale_factor)}")
-
-                cmd.extend([
-                    "--export-type=eps",
-                    "-o", output_path,
-                    svg_file
-                ])
-                
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
-                self.log_update.emit(f"Created EPS (via Inkscape fallback): {output_path}")
+                    self.log(f"Could not determine SVG width, using default for scaling.")
+                    export_width = int(1000 * self.scale_factor)
+
+                _atomic_write(output_path, lambda tmp_path: _inkscape_export('eps', inkscape_exe, svg_file, tmp_path, [
+                    f"export-width:{export_width}",
+                    "export-type:eps",
+                ]))
+                self.log(f"Created EPS (via Inkscape fallback): {output_path}")
             except Exception as e2:
-                self.log_update.emit(f"ERROR creating EPS with Inkscape fallback: {e2}")
+                self.log(f"ERROR creating EPS with Inkscape fallback: {e2}")
                 return None
 
         return output_path
 
     def copy_svg(self, svg_file, base_name, platform):
         """Copy SVG file as-is"""
-        output_path = os.path.join(self.output_dir, platform, f"{base_name}.svg")
+        output_path = self._platform_paths[platform] / f"{base_name}.svg"
+        
+        if self._up_to_date(svg_file, output_path):
+            return output_path
         
-        with open(svg_file, 'rb') as src, open(output_path, 'wb') as dst:
-            dst.write(src.read())
+        # Other outputs of this file may need the bytes too, so read them through the cache
+        svg_data = self._svg_bytes(svg_file)
+        _atomic_write(output_path, lambda tmp_path: Path(tmp_path).write_bytes(svg_data))
             
-        self.log_update.emit(f"Copied SVG: {output_path}")
+        self.log(f"Copied SVG: {output_path}")
         return output_path
     
     def convert_svg_cropped(self, svg_file, base_name, platform):
         """Convert SVG with cropping using Inkscape CLI (fit canvas to drawing)"""
-        output_path = os.path.join(self.output_dir, platform, f"{base_name}.svg")
+        output_path = self._platform_paths[platform] / f"{base_name}.svg"
+        
+        if self._up_to_date(svg_file, output_path):
+            return output_path
         
         try:
             # Find Inkscape executable
-            inkscape_exe = self.find_inkscape()
+            inkscape_exe = find_inkscape()
             if not inkscape_exe:
-                self.log_update.emit("WARNING: Inkscape not found, falling back to basic cropping")
+                self.log("WARNING: Inkscape not found, falling back to basic cropping")
                 return self.copy_svg(svg_file, base_name, platform)
             
             # Use Inkscape to crop (fit canvas to drawing)
-            cmd = [
-                inkscape_exe,
-                "--export-area-drawing",
-                "--export-type=svg",
-                "-o", output_path,
-                svg_file
-            ]
-            
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self.log_update.emit(f"Created cropped SVG using Inkscape: {output_path}")
+            _atomic_write(output_path, lambda tmp_path: _inkscape_export('cropped', inkscape_exe, svg_file, tmp_path, [
+                "export-area-drawing",
+                "export-type:svg",
+            ]))
+            self.log(f"Created cropped SVG using Inkscape: {output_path}")
             return output_path
             
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            self.log_update.emit(f"WARNING: Inkscape cropping failed: {e}, falling back to basic cropping")
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            self.log(f"WARNING: Inkscape cropping failed: {e}, falling back to basic cropping")
             # Fallback to basic cropping
             return self.copy_svg(svg_file, base_name, platform)
     
-    def find_inkscape(self):
-    # Hardcode untuk Windows
-        possible_paths = [
-            r"C:\Program Files\Inkscape\bin\inkscape.exe",
-            r"C:\Program Files\Inkscape\inkscape.exe"
-        ]
-        for p in possible_paths:
-            if os.path.exists(p):
-                return p
-
-        # Hardcode untuk macOS
-        mac_path = "/Applications/Inkscape.app/Contents/MacOS/inkscape"
-        if os.path.exists(mac_path):
-            return mac_path
-
-        # fallback
-        return shutil.which("inkscape")
+    def convert_to_zip(self, svg_file, base_name, platform):
+        """Create a ZIP with the PNG and EPS versions, keeping only the ZIP"""
+        zip_path = self._platform_paths[platform] / f"{base_name}.zip"
+        if self._up_to_date(svg_file, zip_path):
+            return zip_path
+        
+        png_path = self.convert_to_png(svg_file, base_name, platform)
+        eps_path = self.convert_to_eps(svg_file, base_name, platform)
+        zip_path = self.create_zip_file([png_path, eps_path], base_name, platform)
+        
+        # Delete PNG and EPS files after ZIP creation
+        self.delete_files([png_path, eps_path])
+        return zip_path
     
     def create_zip_file(self, file_paths, base_name, platform):
         """Create ZIP file containing specified files"""
-        zip_path = os.path.join(self.output_dir, platform, f"{base_name}.zip")
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in file_paths:
-                if os.path.exists(file_path):
-                    zipf.write(file_path, os.path.basename(file_path))
-        
-        self.log_update.emit(f"Created ZIP: {zip_path}")
+        zip_path = self._platform_paths[platform] / f"{base_name}.zip"
+        
+        def write_zip(tmp_path):
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_STORED) as zipf:
+                for file_path in file_paths:
+                    if file_path and os.path.exists(file_path):
+                        # PNG data is already deflated; only the text-based EPS gains from a (fast) deflate pass
+                        if Path(file_path).suffix.lower() == '.eps':
+                            zipf.write(file_path, os.path.basename(file_path),
+                                       compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+                        else:
+                            zipf.write(file_path, os.path.basename(file_path))
+        
+        _atomic_write(zip_path, write_zip)
+        
+        self.log(f"Created ZIP: {zip_path}")
         return zip_path
     
     def delete_files(self, file_paths):
         """Delete specified files"""
         for file_path in file_paths:
-            if os.path.exists(file_path):
+            if file_path and os.path.exists(file_path):
                 try:
                     os.remove(file_path)
-                    self.log_update.emit(f"Deleted file: {file_path}")
+                    self.log(f"Deleted file: {file_path}")
                 except Exception as e:
-                    self.log_update.emit(f"ERROR deleting file {file_path}: {e}")
+                    self.log(f"ERROR deleting file {file_path}: {e}")
+
+
+def _init_process(log_queue, output_dir, selected_formats, scale_factor, force_1x1, force_rebuild):
+    """Pool initializer: set up this process's FileConverter, logging to the shared queue"""
+    global _converter
+    _converter = FileConverter(output_dir, selected_formats, scale_factor, force_1x1, force_rebuild,
+                               log=log_queue.put)
+
+
+def process_file(svg_file):
+    """Convert one SVG file; runs inside a worker process"""
+    _converter.process_file(svg_file, os.path.basename(svg_file))
+    return svg_file
+
+
+class ConversionWorker(QThread):
+    progress_update = pyqtSignal(int, str)
+    log_update = pyqtSignal(str)
+    finished = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+
+    # Log lines are sent to the UI in batches: whichever limit is hit first
+    LOG_BATCH_SIZE = 32
+    LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+    def __init__(self, svg_files, output_dir, selected_formats, scale_factor, force_1x1, force_rebuild=False):
+        super().__init__()
+        self.svg_files = svg_files
+        self.output_dir = output_dir
+        self.selected_formats = selected_formats
+        self.scale_factor = scale_factor
+        self.force_1x1 = force_1x1
+        self.force_rebuild = force_rebuild
+        self._log_buf = []
+        self._last_log_flush = time.monotonic()
+        self._cancel = threading.Event()
+        
+    def run(self):
+        try:
+            total_files = len(self.svg_files)
+            done_count = 0
+            cancelled = False
+            
+            # Create output directories
+            self.create_output_directories()
+            
+            # Spawn rather than fork: forking from this QThread can copy locks held by
+            # Qt or other threads into the children and deadlock them
+            mp_context = multiprocessing.get_context('spawn')
+            with mp_context.Manager() as manager:
+                log_queue = manager.Queue()
+                log_thread = threading.Thread(target=self._forward_log, args=(log_queue,), daemon=True)
+                log_thread.start()
+                
+                try:
+                    # Files are independent, so convert them in parallel processes
+                    max_workers = min(os.cpu_count() or 1, total_files)
+                    if sys.platform == 'win32':
+                        # ProcessPoolExecutor refuses more than 61 workers on Windows
+                        max_workers = min(max_workers, 61)
+                    with ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=mp_context,
+                                             initializer=_init_process,
+                                             initargs=(log_queue, self.output_dir, self.selected_formats,
+                                                       self.scale_factor, self.force_1x1,
+                                                       self.force_rebuild)) as executor:
+                        pending = {executor.submit(process_file, svg_file) for svg_file in self.svg_files}
+                        try:
+                            # Poll, so a cancel request is noticed while files are converting
+                            while pending and not self._cancel.is_set():
+                                done, pending = wait_futures(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                                for future in done:
+                                    file_name = os.path.basename(future.result())
+                                    done_count += 1
+                                    current_progress = int((done_count / total_files) * 100)
+                                    self.progress_update.emit(current_progress, f"[{done_count}/{total_files}] Processed {file_name}")
+                        finally:
+                            # Drop files that haven't started (on cancel or error); files in
+                            # progress finish, and their worker processes then exit cleanly
+                            executor.shutdown(wait=True, cancel_futures=True)
+                        # Files that were in progress at cancel time completed during shutdown
+                        done_count += sum(1 for future in pending
+                                          if not future.cancelled() and future.exception() is None)
+                        # A Stop that arrives once nothing is left to drop doesn't cancel the run
+                        cancelled = any(future.cancelled() for future in pending)
+                finally:
+                    # Sentinel: stop forwarding once every queued line is out
+                    log_queue.put(None)
+                    log_thread.join()
+            
+            if cancelled:
+                self._log(f"Conversion cancelled after {done_count} of {total_files} files")
+                self._flush_log()
+                return
+                
+            self.progress_update.emit(100, "Conversion completed!")
+            self._log("All conversions completed successfully!")
+            self._flush_log()
+            self.finished.emit()
+            
+        except Exception as e:
+            self._flush_log()
+            self.error_occurred.emit(str(e))
+    
+    def cancel(self):
+        """Ask the conversion to stop after the files currently in progress"""
+        self._cancel.set()
+    
+    def _log(self, message):
+        """Queue a log line for the UI, sending the batch when it is due"""
+        self._log_buf.append(message)
+        if (len(self._log_buf) >= self.LOG_BATCH_SIZE
+                or time.monotonic() - self._last_log_flush >= self.LOG_FLUSH_INTERVAL):
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Send all queued log lines to the UI as one signal"""
+        if self._log_buf:
+            self.log_update.emit("\n".join(self._log_buf))
+            self._log_buf = []
+        self._last_log_flush = time.monotonic()
+    
+    def _forward_log(self, log_queue):
+        """Forward log lines from the worker processes to the UI"""
+        while True:
+            try:
+                message = log_queue.get(timeout=self.LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                # Nothing new; don't hold back lines that are already waiting
+                self._flush_log()
+                continue
+            if message is None:
+                break
+            self._log(message)
+        self._flush_log()
+    
+    def create_output_directories(self):
+        """Create output directories for each platform"""
+        for platform_key, platform_name in PLATFORMS.items():
+            if platform_key in self.selected_formats:
+                platform_dir = os.path.join(self.output_dir, platform_name)
+                os.makedirs(platform_dir, exist_ok=True)
+                self._log(f"Created directory: {platform_dir}")
 
 
 class SVGConverterApp(QMainWindow):
@@ -461,6 +909,12 @@ class SVGConverterApp(QMainWindow):
         self.force_1x1_checkbox = QCheckBox("Force 1:1 Aspect Ratio")
         layout.addWidget(self.force_1x1_checkbox)
         
+        self.force_rebuild_checkbox = QCheckBox("Force rebuild")
+        self.force_rebuild_checkbox.setToolTip(
+            "Re-create every output, even ones newer than their SVG (e.g. after changing the scale)"
+        )
+        layout.addWidget(self.force_rebuild_checkbox)
+        
         layout.addStretch()
         
         return group
@@ -563,8 +1017,16 @@ class SVGConverterApp(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setReadOnly(True)
+        # Keep only the latest lines so layout cost stays bounded on big batches
+        self.log_text.document().setMaximumBlockCount(2000)
         layout.addWidget(self.log_text)
         
+        # Scroll to the newest line at most every 100 ms instead of on every update
+        self.log_scroll_timer = QTimer(self)
+        self.log_scroll_timer.setSingleShot(True)
+        self.log_scroll_timer.setInterval(100)
+        self.log_scroll_timer.timeout.connect(self.scroll_log_to_bottom)
+        
         return group
     
     def _update_start_button_state(self):
@@ -579,11 +1041,10 @@ class SVGConverterApp(QMainWindow):
         
         if directory:
             self.input_dir = directory
-            # Find all SVG files in the directory
-            svg_files = []
-            for file in os.listdir(directory):
-                if file.lower().endswith('.svg'):
-                    svg_files.append(os.path.join(directory, file))
+            # Find all SVG files in the directory (scandir gives file types without extra stat calls)
+            with os.scandir(directory) as entries:
+                svg_files = [entry.path for entry in entries
+                             if entry.name[-4:].lower() == '.svg' and entry.is_file()]
             
             self.svg_files = svg_files
             
@@ -656,13 +1117,15 @@ class SVGConverterApp(QMainWindow):
         
         scale_factor = self.scale_combo.currentData()
         force_1x1 = self.force_1x1_checkbox.isChecked()
+        force_rebuild = self.force_rebuild_checkbox.isChecked()
         
         self.worker = ConversionWorker(
             self.svg_files, 
             self.output_dir, 
             selected_formats, 
             scale_factor,
-            force_1x1
+            force_1x1,
+            force_rebuild
         )
         
         self.worker.progress_update.connect(self.update_progress)
@@ -679,7 +1142,8 @@ class SVGConverterApp(QMainWindow):
     
     def stop_conversion(self):
         if self.worker and self.worker.isRunning():
-            self.worker.terminate()
+            # Let files in progress finish rather than killing the thread mid-write
+            self.worker.cancel()
             self.worker.wait()
             self.conversion_finished()
             self.log_text.append("Conversion stopped by user")
@@ -689,7 +1153,16 @@ class SVGConverterApp(QMainWindow):
         self.progress_label.setText(text)
     
     def update_log(self, message):
+        # Follow new lines only while the log is scrolled to the bottom (or a scroll is pending)
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = self.log_scroll_timer.isActive() or scroll_bar.value() >= scroll_bar.maximum() - 4
+        
+        # message may hold several lines; append them in one go
         self.log_text.append(message)
+        if at_bottom and not self.log_scroll_timer.isActive():
+            self.log_scroll_timer.start()
+    
+    def scroll_log_to_bottom(self):
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()
         )
@@ -717,4 +1190,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for the conversion process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()